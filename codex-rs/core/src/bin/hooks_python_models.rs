@@ -99,11 +99,22 @@ Docs:
 - Machine-readable schema: docs/xcodex/hooks.schema.json
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Mapping, Optional
 
+# Slotted instances skip the per-event `__dict__`, and keyword-only fields keep
+# construction independent of field order; both options need Python 3.10+.
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True, "kw_only": True} if sys.version_info >= (3, 10) else {}
+)
+
 
 def _as_str(value: Any) -> Optional[str]:
+    # Payloads come from the Rust emitter, so values usually already have the declared
+    # type; check for that exact type first and only then fall back to coercion.
+    if type(value) is str:
+        return value
     if value is None:
         return None
     if isinstance(value, str):
@@ -115,6 +126,8 @@ def _as_str(value: Any) -> Optional[str]:
 
 
 def _as_int(value: Any) -> Optional[int]:
+    if type(value) is int:
+        return value
     if value is None:
         return None
     if isinstance(value, bool):
@@ -131,7 +144,13 @@ def _as_int(value: Any) -> Optional[int]:
     return None
 
 
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "n", "off"})
+
+
 def _as_bool(value: Any) -> Optional[bool]:
+    if type(value) is bool:
+        return value
     if value is None:
         return None
     if isinstance(value, bool):
@@ -140,9 +159,9 @@ def _as_bool(value: Any) -> Optional[bool]:
         return value != 0
     if isinstance(value, str):
         v = value.strip().lower()
-        if v in ("true", "1", "yes", "y", "on"):
+        if v in _TRUE_STRINGS:
             return True
-        if v in ("false", "0", "no", "n", "off"):
+        if v in _FALSE_STRINGS:
             return False
     return None
 
@@ -153,15 +172,39 @@ def _as_str_list(value: Any) -> Optional[List[str]]:
     if isinstance(value, list):
         out: List[str] = []
         for item in value:
-            s = _as_str(item)
+            s = item if type(item) is str else _as_str(item)
             if s is not None:
                 out.append(s)
         return out
     return None
 
 
-@dataclass
+def _as_list(value: Any) -> Optional[List[Any]]:
+    return value if isinstance(value, list) else None
+
+
+_KNOWN_KEYS = frozenset(
+    {
+"#,
+    );
+    for key in &keys {
+        writeln!(&mut out, "        {key:?},").map_err(|_| "formatting failed".to_string())?;
+    }
+    out.push_str(
+        r#"    }
+)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class HookPayload:
+    """
+    A hook payload with typed attribute access.
+
+    `raw` is the mapping that was passed to `parse_hook_payload()`, shared by reference
+    rather than copied. Treat it as read-only; use `dict(event.raw)` if you need a
+    mutable copy.
+    """
+
 "#,
     );
 
@@ -187,23 +230,28 @@ class HookPayload:
 
     out.push_str(
         r#"
-
-    raw: Dict[str, Any] = None  # type: ignore[assignment]
-    extras: Dict[str, Any] = None  # type: ignore[assignment]
+    # Backs `raw`; `extras` is derived from it lazily on first access.
+    _payload: Mapping[str, Any] = field(default_factory=dict, repr=False)
+    _extras: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def raw(self) -> Mapping[str, Any]:
+        return self._payload
+
+    @property
+    def extras(self) -> Dict[str, Any]:
+        if self._extras is None:
+            # Usually there are no unknown keys: a C-level set difference settles that
+            # without walking the payload in Python.
+            extra_keys = self._payload.keys() - _KNOWN_KEYS
+            self._extras = (
+                {k: v for (k, v) in self._payload.items() if k in extra_keys} if extra_keys else {}
+            )
+        return self._extras
 
 
 def parse_hook_payload(payload: Mapping[str, Any]) -> HookPayload:
-    raw = dict(payload)
-    known = {
-"#,
-    );
-    for key in &keys {
-        writeln!(&mut out, "        {key:?},").map_err(|_| "formatting failed".to_string())?;
-    }
-    out.push_str(
-        r#"    }
-    extras = {k: v for (k, v) in raw.items() if k not in known}
-
+    get = payload.get
     return HookPayload(
 "#,
     );
@@ -214,12 +262,15 @@ def parse_hook_payload(payload: Mapping[str, Any]) -> HookPayload:
                 .get(*key)
                 .ok_or("property disappeared while iterating")?,
         );
-        writeln!(&mut out, "        {key}={extractor}(raw.get({key:?})),")
-            .map_err(|_| "formatting failed".to_string())?;
+        // Opaque values (`$ref`s and untyped schemas) are passed through as-is.
+        match extractor {
+            Some(extractor) => writeln!(&mut out, "        {key}={extractor}(get({key:?})),"),
+            None => writeln!(&mut out, "        {key}=get({key:?}),"),
+        }
+        .map_err(|_| "formatting failed".to_string())?;
     }
     out.push_str(
-        r#"        raw=raw,
-        extras=extras,
+        r#"        _payload=payload,
     )
 "#,
     );
@@ -231,7 +282,7 @@ def parse_hook_payload(payload: Mapping[str, Any]) -> HookPayload:
 fn py_hint_for_schema(schema: &Value, optional: bool) -> String {
     let base = if schema.get("$ref").is_some() {
         "Any".to_string()
-    } else if let Some(ty) = schema.get("type").and_then(Value::as_str) {
+    } else if let Some(ty) = schema_type(schema) {
         match ty {
             "string" => "str".to_string(),
             "integer" | "number" => "int".to_string(),
@@ -260,24 +311,37 @@ fn py_hint_for_schema(schema: &Value, optional: bool) -> String {
 }
 
 #[cfg(feature = "hooks-schema")]
-fn py_extractor_for_schema(schema: &Value) -> &'static str {
+fn py_extractor_for_schema(schema: &Value) -> Option<&'static str> {
     if schema.get("$ref").is_some() {
-        return "lambda x: x";
+        return None;
     }
 
-    match schema.get("type").and_then(Value::as_str) {
-        Some("string") => "_as_str",
-        Some("integer") | Some("number") => "_as_int",
-        Some("boolean") => "_as_bool",
+    match schema_type(schema) {
+        Some("string") => Some("_as_str"),
+        Some("integer") | Some("number") => Some("_as_int"),
+        Some("boolean") => Some("_as_bool"),
         Some("array") => {
             if let Some(items) = schema.get("items")
                 && items.get("type").and_then(Value::as_str) == Some("string")
             {
-                "_as_str_list"
+                Some("_as_str_list")
             } else {
-                "lambda x: x if isinstance(x, list) else None"
+                Some("_as_list")
             }
         }
-        _ => "lambda x: x",
+        _ => None,
+    }
+}
+
+/// The non-null `type` of a schema; optional fields are emitted as `["<type>", "null"]`.
+#[cfg(feature = "hooks-schema")]
+fn schema_type(schema: &Value) -> Option<&str> {
+    match schema.get("type")? {
+        Value::String(ty) => Some(ty.as_str()),
+        Value::Array(types) => types
+            .iter()
+            .filter_map(Value::as_str)
+            .find(|ty| *ty != "null"),
+        _ => None,
     }
 }
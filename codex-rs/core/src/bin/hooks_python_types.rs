@@ -79,6 +79,9 @@ Re-generate from the repo:\n\
   cd codex-rs\n\
   cargo run -p codex-core --bin hooks_python_types --features hooks-schema --quiet \\\n\
     > common/src/hooks_sdk_assets/python/xcodex_hooks_types.py\n\n\
+These types are for static checking. Import them under `typing.TYPE_CHECKING`\n\
+(as `xcodex_hooks.py` and `xcodex_hooks_runtime.py` do) so hook processes don't\n\
+build the TypedDict at startup.\n\n\
 Docs:\n\
 - Hooks overview: docs/xcodex/hooks.md\n\
 - Machine-readable schema: docs/xcodex/hooks.schema.json\n\
@@ -89,7 +92,7 @@ Docs:\n\
 
     out.push_str(
         r#"
-from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
+from typing import Any, Dict, List, Literal, TypedDict, Union
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -3,18 +3,26 @@
 Sample external hook: show a macOS notification on approval requests (if terminal-notifier is installed).
 """
 
+import functools
 import shutil
 import subprocess
+from typing import Optional
 
 import xcodex_hooks
 
 
+@functools.lru_cache(maxsize=1)
+def _notifier() -> Optional[str]:
+    # Resolved lazily (most events return before needing it) and at most once per process.
+    return shutil.which("terminal-notifier")
+
+
 def main() -> int:
     payload = xcodex_hooks.read_payload()
     if payload.get("type") != "approval-requested":
         return 0
 
-    notifier = shutil.which("terminal-notifier")
+    notifier = _notifier()
     if notifier is None:
         return 0
 
@@ -23,7 +31,14 @@ def main() -> int:
     title = "xcodex approval requested"
     message = f"kind={kind} cwd={cwd}".strip()
 
-    subprocess.run([notifier, "-title", title, "-message", message], check=False)
+    # Fire and forget: don't hold up the hook waiting for the notification UI.
+    subprocess.Popen(
+        [notifier, "-title", title, "-message", message],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
     return 0
 
 
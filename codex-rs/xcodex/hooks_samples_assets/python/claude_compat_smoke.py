@@ -7,32 +7,38 @@ This is useful when validating Claude-style hooks against xcodex:
 - `xcodex_event_type` is the canonical xcodex event type string
 """
 
-import json
 import os
-import pathlib
+from typing import Any
 
 import xcodex_hooks
 
+# Compact JSON; the stdlib fallback uses orjson's separators.
+try:
+    from orjson import dumps as _dumps
+except ImportError:  # pragma: no cover
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        # The record only holds identifiers and paths, so keep the encoder's ASCII path.
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 
 def main() -> int:
     payload = xcodex_hooks.read_payload()
 
     record = {
-        "hook_event_name": payload.get("hook_event_name") or payload.get("hook-event-name"),
-        "xcodex_event_type": payload.get("xcodex_event_type") or payload.get("xcodex-event-type"),
-        "tool_name": payload.get("tool_name") or payload.get("tool-name"),
+        "hook_event_name": payload.get("hook_event_name"),
+        "xcodex_event_type": payload.get("xcodex_event_type"),
+        "tool_name": payload.get("tool_name"),
         "cwd": payload.get("cwd"),
-        "session_id": payload.get("session_id") or payload.get("session-id"),
-        "turn_id": payload.get("turn_id") or payload.get("turn-id"),
+        "session_id": payload.get("session_id"),
+        "turn_id": payload.get("turn_id"),
     }
 
-    codex_home = pathlib.Path(
-        os.environ.get("CODEX_HOME", str(pathlib.Path.home() / ".xcodex"))
-    )
-    out = codex_home / "hooks-claude-compat-smoke.jsonl"
-    out.parent.mkdir(parents=True, exist_ok=True)
-    with out.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    codex_home = os.environ.get("CODEX_HOME") or os.path.expanduser("~/.xcodex")
+    os.makedirs(codex_home, exist_ok=True)
+    with open(os.path.join(codex_home, "hooks-claude-compat-smoke.jsonl"), "ab") as f:
+        f.write(_dumps(record) + b"\n")
 
     return 0
 
@@ -2,26 +2,41 @@
 """
 Sample external hook: log every hook payload as one JSON object per line.
 
-Customize by editing `main()` below. This hook is fire-and-forget: failures
+Customize by editing `log_payload()` below. This hook is fire-and-forget: failures
 won't stop Codex, but payloads/logs may contain sensitive data.
+
+Runs once per event by default; the Python hook host can load it instead
+(`host.py hooks/log_all_jsonl.py`) and call `on_event()` from one long-lived process.
 """
 
-import json
 import os
-import pathlib
+from typing import Any, Mapping
 
 import xcodex_hooks
 
+# Compact UTF-8 JSON; the stdlib fallback uses orjson's separators and non-ASCII output.
+try:
+    from orjson import dumps as _dumps
+except ImportError:  # pragma: no cover
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def log_payload(payload: Mapping[str, Any]) -> None:
+    codex_home = os.environ.get("CODEX_HOME") or os.path.expanduser("~/.xcodex")
+    os.makedirs(codex_home, exist_ok=True)
+    with open(os.path.join(codex_home, "hooks.jsonl"), "ab") as f:
+        f.write(_dumps(payload) + b"\n")
+
+
+def on_event(event: Mapping[str, Any]) -> None:
+    log_payload(event)
+
 
 def main() -> int:
-    payload = xcodex_hooks.read_payload()
-    codex_home = pathlib.Path(
-        os.environ.get("CODEX_HOME", str(pathlib.Path.home() / ".xcodex"))
-    )
-    out = codex_home / "hooks.jsonl"
-    out.parent.mkdir(parents=True, exist_ok=True)
-    with out.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(payload) + "\n")
+    log_payload(xcodex_hooks.read_payload())
     return 0
 
 
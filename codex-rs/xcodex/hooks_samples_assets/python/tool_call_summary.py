@@ -2,43 +2,54 @@
 """
 Sample external hook: log compact tool-call summaries to CODEX_HOME/hooks-tool-calls.log.
 
-Customize by editing `main()` below.
+Customize by editing `log_summary()` below.
+
+Runs once per event by default. To keep one Python process up for the whole session,
+point the Python hook host at this file instead; it calls `on_event()`:
+
+  [hooks.host]
+  enabled = true
+  command = ["python3", "-u", "hooks/host/python/host.py", "hooks/tool_call_summary.py"]
 """
 
 import os
-import pathlib
+from typing import Any, Mapping
 
 import xcodex_hooks
 
+_LINE_FORMAT = (
+    "type=tool-call-finished tool=%s status=%s success=%s "
+    "duration_ms=%s output_bytes=%s cwd=%s\n"
+)
 
-def main() -> int:
-    payload = xcodex_hooks.read_payload()
-    if payload.get("type") != "tool-call-finished":
-        return 0
 
-    tool_name = payload.get("tool-name") or payload.get("tool_name") or "unknown"
+def log_summary(payload: Mapping[str, Any]) -> None:
+    tool_name = payload.get("tool_name") or "unknown"
     status = payload.get("status") or "unknown"
-    duration_ms = payload.get("duration-ms") or payload.get("duration_ms") or 0
+    duration_ms = payload.get("duration_ms") or 0
     success = payload.get("success")
-    output_bytes = payload.get("output-bytes") or payload.get("output_bytes") or 0
+    output_bytes = payload.get("output_bytes") or 0
     cwd = payload.get("cwd") or ""
 
-    codex_home = pathlib.Path(
-        os.environ.get("CODEX_HOME", str(pathlib.Path.home() / ".xcodex"))
-    )
-    out = codex_home / "hooks-tool-calls.log"
-    out.parent.mkdir(parents=True, exist_ok=True)
+    codex_home = os.environ.get("CODEX_HOME") or os.path.expanduser("~/.xcodex")
+    os.makedirs(codex_home, exist_ok=True)
+
+    line = _LINE_FORMAT % (tool_name, status, success, duration_ms, output_bytes, cwd)
+    with open(os.path.join(codex_home, "hooks-tool-calls.log"), "ab") as f:
+        f.write(line.encode("utf-8"))
 
-    line = (
-        f"type=tool-call-finished tool={tool_name} status={status} "
-        f"success={success} duration_ms={duration_ms} output_bytes={output_bytes} cwd={cwd}\n"
-    )
-    with out.open("a", encoding="utf-8") as f:
-        f.write(line)
 
+def on_event(event: Mapping[str, Any]) -> None:
+    if event.get("xcodex_event_type") == "tool-call-finished":
+        log_summary(event)
+
+
+def main() -> int:
+    payload = xcodex_hooks.read_payload()
+    if payload.get("xcodex_event_type") == "tool-call-finished":
+        log_summary(payload)
     return 0
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
@@ -14,6 +14,12 @@ Usage (example):
 
   python3 -u "$CODEX_HOME/hooks/host/python/host.py" "$CODEX_HOME/hooks/host/python/example_hook.py"
 
+By default events are delivered to `on_event` one at a time, in order. Pass
+`--workers N` (or set `XCODEX_HOOK_WORKERS=N`) to run up to N calls concurrently
+on a thread pool; events are still submitted in order, but may finish out of
+order. This suits I/O-bound hooks (notifications, HTTP pings) that don't depend
+on ordering.
+
 Protocol (v1):
 
   One JSON object per line. For hook events:
@@ -22,73 +28,190 @@ Protocol (v1):
 The `event` payload uses the same schema as external hooks (see `docs/xcodex/hooks.md`).
 """
 
+import functools
+import importlib.machinery
 import importlib.util
-import json
+import mmap
+import os
 import pathlib
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from types import ModuleType
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Prefer a faster JSON parser when one is installed; the stdlib is the fallback.
+try:
+    from orjson import loads as _loads
+
+    _LOADS_ACCEPTS_BUFFER = True
+except ImportError:  # pragma: no cover
+    try:
+        from msgspec.json import decode as _loads
+
+        _LOADS_ACCEPTS_BUFFER = True
+    except ImportError:
+        _LOADS_ACCEPTS_BUFFER = False
+        try:
+            from ujson import loads as _loads
+        except ImportError:
+            from json import loads as _loads
+
+_READ_SIZE = 64 * 1024
 
 
 def _load_module_from_path(path: str) -> ModuleType:
     module_path = pathlib.Path(path)
-    spec = importlib.util.spec_from_file_location("xcodex_user_hook", module_path)
+    # An explicit SourceFileLoader accepts any file name (not just `*.py`) and caches
+    # compiled bytecode under `__pycache__` (or PYTHONPYCACHEPREFIX), so host restarts
+    # reuse the `.pyc` instead of recompiling the user hook.
+    loader = importlib.machinery.SourceFileLoader("xcodex_user_hook", str(module_path))
+    spec = importlib.util.spec_from_file_location("xcodex_user_hook", module_path, loader=loader)
     if spec is None or spec.loader is None:
         raise RuntimeError(f"failed to load module from {module_path}")
+    # Like the PyO3 loader, make modules next to the hook (e.g. `xcodex_hooks.py` when
+    # the hook lives in `$CODEX_HOME/hooks/`) importable from it.
+    hook_dir = str(module_path.resolve().parent)
+    if hook_dir not in sys.path:
+        sys.path.append(hook_dir)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
     return module
 
 
+# Payload files above this size are parsed straight from a read-only mmap when the
+# parser accepts buffers (orjson, msgspec), instead of first copying the whole file onto the heap.
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+
+def _load_json_file(path: str, size: int) -> Dict[str, Any]:
+    if _LOADS_ACCEPTS_BUFFER and size > _MMAP_THRESHOLD:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
+    return _loads(pathlib.Path(path).read_bytes())
+
+
 def _resolve_event_payload(event_or_envelope: Any) -> Dict[str, Any]:
     if isinstance(event_or_envelope, dict) and (
         "payload_path" in event_or_envelope or "payload-path" in event_or_envelope
     ):
         payload_path = event_or_envelope.get("payload_path") or event_or_envelope.get("payload-path")
         if isinstance(payload_path, str) and payload_path:
-            return json.loads(pathlib.Path(payload_path).read_text(encoding="utf-8"))
+            # Payload files are uniquely named per event, so there is nothing to cache.
+            return _load_json_file(payload_path, os.path.getsize(payload_path))
     if isinstance(event_or_envelope, dict):
         return event_or_envelope
     return {}
 
 
+def _call_hook(on_event: Callable[[Dict[str, Any]], None], event: Dict[str, Any]) -> None:
+    try:
+        on_event(event)
+    except Exception:
+        sys.stderr.write("hook host: user hook raised\n")
+        traceback.print_exc(file=sys.stderr)
+
+
+def _dispatch_line(raw_line: bytes, call_hook: Callable[[Dict[str, Any]], Any]) -> None:
+    raw_line = raw_line.strip()
+    if not raw_line:
+        return
+
+    try:
+        msg = _loads(raw_line)
+    except Exception:
+        sys.stderr.write("hook host: failed to parse JSON line\n")
+        sys.stderr.write(raw_line.decode("utf-8", errors="replace") + "\n")
+        return
+
+    if msg.get("type") != "hook-event":
+        return
+
+    call_hook(_resolve_event_payload(msg.get("event")))
+
+
+def _parse_workers(value: str) -> Optional[int]:
+    try:
+        count = int(value, 10)
+    except ValueError:
+        return None
+    return count if count >= 1 else None
+
+
+def _parse_args(argv: List[str]) -> Optional[Tuple[str, int]]:
+    if len(argv) == 3 and argv[0] == "--workers":
+        workers = _parse_workers(argv[1])
+        if workers is None:
+            return None
+        argv = argv[2:]
+    else:
+        workers = 1
+        env_workers = os.environ.get("XCODEX_HOOK_WORKERS")
+        if env_workers:
+            workers = _parse_workers(env_workers)
+            if workers is None:
+                # A bad environment value shouldn't stop hooks from running at all.
+                sys.stderr.write(
+                    f"hook host: ignoring invalid XCODEX_HOOK_WORKERS={env_workers!r}; using 1\n"
+                )
+                workers = 1
+    if len(argv) != 1:
+        return None
+    return argv[0], workers
+
+
 def main() -> int:
-    if len(sys.argv) != 2:
+    args = _parse_args(sys.argv[1:])
+    if args is None:
         sys.stderr.write(
-            "usage: host.py /absolute/path/to/user_hook.py\n"
+            "usage: host.py [--workers N] /absolute/path/to/user_hook.py\n"
             "expected user_hook to define: on_event(event: dict) -> None\n"
         )
         return 2
 
-    module_path = sys.argv[1]
+    module_path, workers = args
     module = _load_module_from_path(module_path)
     on_event = getattr(module, "on_event", None)
     if not callable(on_event):
         sys.stderr.write(f"{module_path} must define a callable on_event(event: dict)\n")
         return 2
 
-    for raw_line in sys.stdin:
-        raw_line = raw_line.strip()
-        if not raw_line:
-            continue
-
-        try:
-            msg = json.loads(raw_line)
-        except Exception:
-            sys.stderr.write("hook host: failed to parse JSON line\n")
-            sys.stderr.write(raw_line + "\n")
-            continue
-
-        if msg.get("type") != "hook-event":
-            continue
-
-        event = _resolve_event_payload(msg.get("event"))
-        try:
-            on_event(event)
-        except Exception:
-            sys.stderr.write("hook host: user hook raised\n")
-            traceback.print_exc(file=sys.stderr)
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    if executor is None:
+        call_hook = functools.partial(_call_hook, on_event)
+    else:
+        call_hook = functools.partial(executor.submit, _call_hook, on_event)
+
+    # Read stdin as raw bytes in large chunks and split on newlines ourselves:
+    # this skips the text-mode decode and lets the JSON parser consume bytes directly.
+    # The user hook and the helpers are resolved once and bound to locals, so the
+    # per-line loop does no global/attribute lookups.
+    read1 = sys.stdin.buffer.read1
+    dispatch = _dispatch_line
+    try:
+        # Bytes of the current, not yet newline-terminated line. Appending to a bytearray
+        # keeps very long lines (spanning many reads) linear instead of re-copying them.
+        pending = bytearray()
+        while True:
+            data = read1(_READ_SIZE)
+            if not data:
+                break
+            lines = data.split(b"\n")
+            if len(lines) == 1:
+                pending += data
+                continue
+            if pending:
+                pending += lines[0]
+                lines[0] = bytes(pending)
+                pending.clear()
+            pending += lines.pop()
+            for line in lines:
+                dispatch(line, call_hook)
+        dispatch(bytes(pending), call_hook)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
 
     return 0
 
@@ -12,15 +12,25 @@ It appends compact summaries for `tool-call-finished` events to:
 """
 
 import os
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
+# The host process outlives individual events, so resolve (and fs-encode) the log
+# path once and append with a single write on an O_APPEND descriptor.
+_CODEX_HOME = os.environ.get("CODEX_HOME")
+_OUT_PATH: Optional[bytes] = (
+    os.fsencode(os.path.join(_CODEX_HOME, "hooks-host-tool-calls.log")) if _CODEX_HOME else None
+)
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
 
-def on_event(event: Dict[str, Any]) -> None:
-    if event.get("xcodex_event_type") != "tool-call-finished":
-        return
+# Formatted once per tool call, so use a single `%` over a fixed template.
+_LINE_FORMAT = (
+    "type=tool-call-finished tool=%s status=%s success=%s "
+    "duration_ms=%s output_bytes=%s cwd=%s\n"
+)
 
-    codex_home = os.environ.get("CODEX_HOME")
-    if not codex_home:
+
+def _on_tool_call_finished(event: Dict[str, Any]) -> None:
+    if _OUT_PATH is None:
         return
 
     tool = event.get("tool_name", "?")
@@ -30,11 +40,23 @@ def on_event(event: Dict[str, Any]) -> None:
     output_bytes = event.get("output_bytes", 0)
     cwd = event.get("cwd", "")
 
-    line = (
-        f"type=tool-call-finished tool={tool} status={status} success={success} "
-        f"duration_ms={duration_ms} output_bytes={output_bytes} cwd={cwd}\n"
-    )
+    line = _LINE_FORMAT % (tool, status, success, duration_ms, output_bytes, cwd)
+
+    fd = os.open(_OUT_PATH, _APPEND_FLAGS, 0o644)
+    try:
+        os.write(fd, line.encode("utf-8"))
+    finally:
+        os.close(fd)
 
-    out_path = os.path.join(codex_home, "hooks-host-tool-calls.log")
-    with open(out_path, "a", encoding="utf-8") as f:
-        f.write(line)
+
+# One handler per `xcodex_event_type`; add entries here rather than growing an
+# if/elif chain in `on_event`.
+_HANDLERS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    "tool-call-finished": _on_tool_call_finished,
+}
+
+
+def on_event(event: Dict[str, Any]) -> None:
+    handler = _HANDLERS.get(event.get("xcodex_event_type"))
+    if handler is not None:
+        handler(event)
@@ -18,13 +18,14 @@ or automatically by:
 """
 
 import json
-import os
-import pathlib
+import os.path
 import sys
 
 # Ensure `$CODEX_HOME/hooks/` (which contains `xcodex_hooks.py`) is importable
 # when this template is executed from `$CODEX_HOME/hooks/templates/python/`.
-sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+# Plain string dirname()s: this runs on every hook invocation, and unlike
+# `Path.resolve()` it doesn't stat each path component.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 import xcodex_hooks  # noqa: E402
 
 
@@ -32,10 +33,9 @@ def main() -> int:
     # Parse the event payload (handles stdin vs payload_path envelopes).
     payload = xcodex_hooks.read_payload()
 
-    codex_home = pathlib.Path(os.environ.get("CODEX_HOME", str(pathlib.Path.home() / ".xcodex")))
-    out = codex_home / "hooks.jsonl"
-    out.parent.mkdir(parents=True, exist_ok=True)
-    with out.open("a", encoding="utf-8") as f:
+    codex_home = os.environ.get("CODEX_HOME") or os.path.expanduser("~/.xcodex")
+    os.makedirs(codex_home, exist_ok=True)
+    with open(os.path.join(codex_home, "hooks.jsonl"), "a", encoding="utf-8") as f:
         # Add your logic here. This template just logs the full payload.
         f.write(json.dumps(payload) + "\n")
 
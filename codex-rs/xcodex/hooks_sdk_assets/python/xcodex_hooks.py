@@ -9,7 +9,10 @@ This file is meant to be vendored into `$CODEX_HOME/hooks/` via:
 
 It provides a single convenience function, `read_payload()`, that hides the
 most error-prone part of writing external hooks: handling stdin vs the
-`payload_path` envelope that Codex uses for large payloads.
+`payload_path` envelope that Codex uses for large payloads. `peek_event_type()`
+lets a hook skip events it doesn't handle before parsing anything, and
+`codex_home()` resolves the directory hooks usually write their output to, and
+`append_bytes()` appends a log line to a file there.
 
 Optional typed helpers:
 - `xcodex_hooks_types.py` contains generated TypedDict event types.
@@ -22,25 +25,73 @@ Docs:
 - Authoritative config reference: docs/config.md#hooks
 """
 
-import json
-import pathlib
+import functools
+import mmap
+import os
 import sys
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, AbstractSet, Any, Dict, Optional, Union, overload
 
 if TYPE_CHECKING:
     from xcodex_hooks_types import HookPayload
 
 
-def read_payload(raw: Optional[str] = None) -> "HookPayload":
+# Prefer a faster JSON parser when one is installed; the stdlib is the fallback.
+try:
+    from orjson import loads as _loads
+
+    _LOADS_ACCEPTS_BUFFER = True
+except ImportError:  # pragma: no cover
+    try:
+        from msgspec.json import decode as _loads
+
+        _LOADS_ACCEPTS_BUFFER = True
+    except ImportError:
+        _LOADS_ACCEPTS_BUFFER = False
+        try:
+            from ujson import loads as _loads
+        except ImportError:
+            from json import loads as _loads
+
+
+# Payload files above this size are parsed straight from a read-only mmap when the
+# parser accepts buffers (orjson, msgspec), instead of first copying the whole file onto the heap.
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+
+def _load_json_file(path: str, size: int) -> Dict[str, Any]:
+    if _LOADS_ACCEPTS_BUFFER and size > _MMAP_THRESHOLD:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+@overload
+def read_payload(raw: Optional[Union[str, bytes]] = None) -> "HookPayload": ...
+
+
+@overload
+def read_payload(
+    raw: Optional[Union[str, bytes]] = None, *, event_types: AbstractSet[str]
+) -> Optional["HookPayload"]: ...
+
+
+def read_payload(
+    raw: Optional[Union[str, bytes]] = None, *, event_types: Optional[AbstractSet[str]] = None
+) -> Optional["HookPayload"]:
     """
     Read a hook payload as a dict.
 
     Input:
-    - If `raw` is provided, it is treated as the full stdin string.
-    - Otherwise, the function reads stdin (`sys.stdin.read()`).
+    - If `raw` is provided (str or bytes), it is treated as the full stdin contents.
+    - Otherwise, the function reads stdin as bytes (`sys.stdin.buffer.read()`).
+
+    - If `event_types` is provided, only those `xcodex_event_type`s are parsed.
 
     Output:
-    - Returns the full payload dict for the event.
+    - Returns the full payload dict for the event, or None if `event_types` is
+      provided and the event isn't one of them.
 
     Behavior:
     - For small payloads, stdin is the full JSON payload.
@@ -53,21 +104,55 @@ def read_payload(raw: Optional[str] = None) -> "HookPayload":
         if payload.get("hook_event_name") != "PostToolUse":
             return 0
         # ... your logic ...
+
+    Hooks that only handle some events can pass `event_types`. For `payload_path`
+    envelopes the event type is read with a byte scan (see `peek_event_type()`), so
+    unwanted large payloads are rejected without reading the payload file; everything
+    else is decided by the parsed top-level `xcodex_event_type`:
+
+        payload = read_payload(event_types={"tool-call-finished"})
+        if payload is None:
+            return 0
     """
-    if raw is None:
-        raw = sys.stdin.read()
+    # Hand bytes straight to the parser (it decodes UTF-8 itself) rather than
+    # decoding stdin / the payload file into a `str` first.
+    data = sys.stdin.buffer.read() if raw is None else raw
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    # Only trust the byte scan on flat objects like the envelope: in a full payload
+    # serde writes `tool_input` / `tool_response` first, so a nested key can win it.
+    if event_types is not None and _is_flat_object(data):
+        event_type = peek_event_type(data)
+        if event_type is not None and event_type not in event_types:
+            return None
+
+    payload = _payload_from_bytes(data)
+    if event_types is not None and payload.get("xcodex_event_type") not in event_types:
+        return None
+    return payload
+
+
+def _is_flat_object(data: bytes) -> bool:
+    # One `{` and no `[` means no nested objects or arrays, so every key is top-level.
+    return data.count(b"{") == 1 and b"[" not in data
 
-    raw = raw or "{}"
-    payload: Dict[str, Any] = json.loads(raw)
 
+def _payload_from_bytes(data: bytes) -> Dict[str, Any]:
+    # Only envelopes mention `payload_path`; a byte probe routes full payloads straight
+    # to a single parse.
+    if b'"payload_path"' not in data and b'"payload-path"' not in data:
+        return _loads(data or b"{}")
+
+    payload: Dict[str, Any] = _loads(data)
     payload_path = payload.get("payload_path") or payload.get("payload-path")
     if payload_path:
-        payload = json.loads(pathlib.Path(payload_path).read_text(encoding="utf-8"))
+        payload = _load_json_file(payload_path, os.path.getsize(payload_path))
 
     return payload
 
 
-def read_payload_model(raw: Optional[str] = None) -> "xcodex_hooks_models.HookPayload":
+def read_payload_model(raw: Optional[Union[str, bytes]] = None) -> "xcodex_hooks_models.HookPayload":
     """
     Read a hook payload and parse it into a dataclass model.
 
@@ -81,3 +166,86 @@ def read_payload_model(raw: Optional[str] = None) -> "xcodex_hooks_models.HookPa
     import xcodex_hooks_models
 
     return xcodex_hooks_models.parse_hook_payload(payload)
+
+
+_EVENT_TYPE_KEY = b'"xcodex_event_type"'
+
+
+def peek_event_type(raw: bytes) -> Optional[str]:
+    """
+    Find `xcodex_event_type` in raw stdin bytes without parsing the JSON.
+
+    The result is only a hint. This is a byte scan, not a parser: it reports the first
+    `"xcodex_event_type"` key in the bytes, and in a full payload that can be a key
+    nested inside `tool_input` / `tool_response` (serde writes those before the
+    top-level field). It returns None if the field can't be found.
+
+    Rejecting an event on the result is only safe for flat input with no nested
+    objects or arrays, such as the `payload_path` envelope, where it lets a hook skip
+    reading a large payload file. `read_payload(event_types=...)` applies that rule
+    for you; prefer it over calling this directly.
+    """
+    start = raw.find(_EVENT_TYPE_KEY)
+    if start < 0:
+        return None
+    start += len(_EVENT_TYPE_KEY)
+    open_quote = raw.find(b'"', start)
+    if open_quote < 0 or raw[start:open_quote].strip() != b":":
+        return None
+    close_quote = raw.find(b'"', open_quote + 1)
+    if close_quote < 0:
+        return None
+    value = raw[open_quote + 1 : close_quote]
+    if b"\\" in value:
+        # Escaped strings need a real JSON parser.
+        return None
+    try:
+        return value.decode("ascii")
+    except UnicodeDecodeError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def codex_home() -> str:
+    """
+    Return `$CODEX_HOME` (default `~/.xcodex`), creating it if needed.
+
+    Resolved once per process, so hooks loaded by a long-lived host don't repeat the
+    environment lookup and `mkdir` on every event:
+
+        out = os.path.join(xcodex_hooks.codex_home(), "hooks.jsonl")
+
+    This returns a plain `str` so that importing this module, which every hook
+    process does, doesn't also pull in `pathlib` (several ms of import time).
+    """
+    home = os.environ.get("CODEX_HOME") or os.path.join(os.path.expanduser("~"), ".xcodex")
+    os.makedirs(home, exist_ok=True)
+    return home
+
+
+_APPEND_FLAGS = (
+    os.O_WRONLY
+    | os.O_APPEND
+    | os.O_CREAT
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_BINARY", 0)
+)
+
+
+def append_bytes(path: Union[str, "os.PathLike[str]"], data: bytes) -> None:
+    """
+    Append `data` to `path`, creating the file if needed.
+
+    This writes straight to an `O_APPEND` descriptor instead of going through
+    `open(path, "a")` and its text/buffer layers. Each `append_bytes()` call lands
+    at the end of the file even when several hooks log to it at once.
+
+        xcodex_hooks.append_bytes(out, line.encode("utf-8"))
+    """
+    fd = os.open(path, _APPEND_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
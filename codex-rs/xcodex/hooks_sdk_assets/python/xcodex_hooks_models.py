@@ -21,11 +21,22 @@ Docs:
 - Machine-readable schema: docs/xcodex/hooks.schema.json
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Mapping, Optional
 
+# Slotted instances skip the per-event `__dict__`, and keyword-only fields keep
+# construction independent of field order; both options need Python 3.10+.
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True, "kw_only": True} if sys.version_info >= (3, 10) else {}
+)
+
 
 def _as_str(value: Any) -> Optional[str]:
+    # Payloads come from the Rust emitter, so values usually already have the declared
+    # type; check for that exact type first and only then fall back to coercion.
+    if type(value) is str:
+        return value
     if value is None:
         return None
     if isinstance(value, str):
@@ -37,6 +48,8 @@ def _as_str(value: Any) -> Optional[str]:
 
 
 def _as_int(value: Any) -> Optional[int]:
+    if type(value) is int:
+        return value
     if value is None:
         return None
     if isinstance(value, bool):
@@ -53,7 +66,13 @@ def _as_int(value: Any) -> Optional[int]:
     return None
 
 
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"false", "0", "no", "n", "off"})
+
+
 def _as_bool(value: Any) -> Optional[bool]:
+    if type(value) is bool:
+        return value
     if value is None:
         return None
     if isinstance(value, bool):
@@ -62,9 +81,9 @@ def _as_bool(value: Any) -> Optional[bool]:
         return value != 0
     if isinstance(value, str):
         v = value.strip().lower()
-        if v in ("true", "1", "yes", "y", "on"):
+        if v in _TRUE_STRINGS:
             return True
-        if v in ("false", "0", "no", "n", "off"):
+        if v in _FALSE_STRINGS:
             return False
     return None
 
@@ -75,74 +94,19 @@ def _as_str_list(value: Any) -> Optional[List[str]]:
     if isinstance(value, list):
         out: List[str] = []
         for item in value:
-            s = _as_str(item)
+            s = item if type(item) is str else _as_str(item)
             if s is not None:
                 out.append(s)
         return out
     return None
 
 
-@dataclass
-class HookPayload:
-    cwd: str
-    event_id: str
-    hook_event_name: str
-    permission_mode: str
-    schema_version: int
-    session_id: str
-    timestamp: str
-    transcript_path: str
-    xcodex_event_type: str
-    approval_policy: Optional[Any] = None
-    attempt: Optional[Any] = None
-    call_id: Optional[Any] = None
-    command: Optional[Any] = None
-    duration_ms: Optional[Any] = None
-    grant_root: Optional[Any] = None
-    has_output_schema: Optional[Any] = None
-    input_item_count: Optional[Any] = None
-    input_messages: Optional[Any] = None
-    kind: Optional[Any] = None
-    last_assistant_message: Optional[Any] = None
-    message: Optional[Any] = None
-    model: Optional[Any] = None
-    model_request_id: Optional[Any] = None
-    needs_follow_up: Optional[Any] = None
-    notification_type: Optional[Any] = None
-    output_bytes: Optional[Any] = None
-    output_preview: Optional[Any] = None
-    parallel_tool_calls: Optional[Any] = None
-    paths: Optional[Any] = None
-    prompt: Optional[Any] = None
-    proposed_execpolicy_amendment: Optional[Any] = None
-    provider: Optional[Any] = None
-    reason: Optional[Any] = None
-    request_id: Optional[Any] = None
-    response_id: Optional[Any] = None
-    sandbox_policy: Optional[Any] = None
-    server_name: Optional[Any] = None
-    session_source: Optional[Any] = None
-    status: Optional[Any] = None
-    subagent: Optional[Any] = None
-    success: Optional[Any] = None
-    title: Optional[Any] = None
-    token_usage: Optional[Any] = None
-    tool_count: Optional[Any] = None
-    tool_input: Optional[Any] = None
-    tool_name: Optional[Any] = None
-    tool_response: Optional[Any] = None
-    tool_use_id: Optional[Any] = None
-    trigger: Optional[Any] = None
-    turn_id: Optional[Any] = None
-
-
-    raw: Dict[str, Any] = None  # type: ignore[assignment]
-    extras: Dict[str, Any] = None  # type: ignore[assignment]
+def _as_list(value: Any) -> Optional[List[Any]]:
+    return value if isinstance(value, list) else None
 
 
-def parse_hook_payload(payload: Mapping[str, Any]) -> HookPayload:
-    raw = dict(payload)
-    known = {
+_KNOWN_KEYS = frozenset(
+    {
         "approval_policy",
         "attempt",
         "call_id",
@@ -194,59 +158,142 @@ def parse_hook_payload(payload: Mapping[str, Any]) -> HookPayload:
         "turn_id",
         "xcodex_event_type",
     }
-    extras = {k: v for (k, v) in raw.items() if k not in known}
+)
 
+
+@dataclass(**_DATACLASS_OPTIONS)
+class HookPayload:
+    """
+    A hook payload with typed attribute access.
+
+    `raw` is the mapping that was passed to `parse_hook_payload()`, shared by reference
+    rather than copied. Treat it as read-only; use `dict(event.raw)` if you need a
+    mutable copy.
+    """
+
+    cwd: str
+    event_id: str
+    hook_event_name: str
+    permission_mode: str
+    schema_version: int
+    session_id: str
+    timestamp: str
+    transcript_path: str
+    xcodex_event_type: str
+    approval_policy: Optional[Any] = None
+    attempt: Optional[int] = None
+    call_id: Optional[str] = None
+    command: Optional[List[str]] = None
+    duration_ms: Optional[int] = None
+    grant_root: Optional[str] = None
+    has_output_schema: Optional[bool] = None
+    input_item_count: Optional[int] = None
+    input_messages: Optional[List[str]] = None
+    kind: Optional[str] = None
+    last_assistant_message: Optional[str] = None
+    message: Optional[str] = None
+    model: Optional[str] = None
+    model_request_id: Optional[str] = None
+    needs_follow_up: Optional[bool] = None
+    notification_type: Optional[str] = None
+    output_bytes: Optional[int] = None
+    output_preview: Optional[str] = None
+    parallel_tool_calls: Optional[bool] = None
+    paths: Optional[List[str]] = None
+    prompt: Optional[str] = None
+    proposed_execpolicy_amendment: Optional[List[str]] = None
+    provider: Optional[str] = None
+    reason: Optional[str] = None
+    request_id: Optional[str] = None
+    response_id: Optional[str] = None
+    sandbox_policy: Optional[Any] = None
+    server_name: Optional[str] = None
+    session_source: Optional[str] = None
+    status: Optional[str] = None
+    subagent: Optional[str] = None
+    success: Optional[bool] = None
+    title: Optional[str] = None
+    token_usage: Optional[Any] = None
+    tool_count: Optional[int] = None
+    tool_input: Optional[Any] = None
+    tool_name: Optional[str] = None
+    tool_response: Optional[Any] = None
+    tool_use_id: Optional[str] = None
+    trigger: Optional[str] = None
+    turn_id: Optional[str] = None
+
+    # Backs `raw`; `extras` is derived from it lazily on first access.
+    _payload: Mapping[str, Any] = field(default_factory=dict, repr=False)
+    _extras: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def raw(self) -> Mapping[str, Any]:
+        return self._payload
+
+    @property
+    def extras(self) -> Dict[str, Any]:
+        if self._extras is None:
+            # Usually there are no unknown keys: a C-level set difference settles that
+            # without walking the payload in Python.
+            extra_keys = self._payload.keys() - _KNOWN_KEYS
+            self._extras = (
+                {k: v for (k, v) in self._payload.items() if k in extra_keys} if extra_keys else {}
+            )
+        return self._extras
+
+
+def parse_hook_payload(payload: Mapping[str, Any]) -> HookPayload:
+    get = payload.get
     return HookPayload(
-        approval_policy=lambda x: x(raw.get("approval_policy")),
-        attempt=lambda x: x(raw.get("attempt")),
-        call_id=lambda x: x(raw.get("call_id")),
-        command=lambda x: x(raw.get("command")),
-        cwd=_as_str(raw.get("cwd")),
-        duration_ms=lambda x: x(raw.get("duration_ms")),
-        event_id=_as_str(raw.get("event_id")),
-        grant_root=lambda x: x(raw.get("grant_root")),
-        has_output_schema=lambda x: x(raw.get("has_output_schema")),
-        hook_event_name=_as_str(raw.get("hook_event_name")),
-        input_item_count=lambda x: x(raw.get("input_item_count")),
-        input_messages=lambda x: x(raw.get("input_messages")),
-        kind=lambda x: x(raw.get("kind")),
-        last_assistant_message=lambda x: x(raw.get("last_assistant_message")),
-        message=lambda x: x(raw.get("message")),
-        model=lambda x: x(raw.get("model")),
-        model_request_id=lambda x: x(raw.get("model_request_id")),
-        needs_follow_up=lambda x: x(raw.get("needs_follow_up")),
-        notification_type=lambda x: x(raw.get("notification_type")),
-        output_bytes=lambda x: x(raw.get("output_bytes")),
-        output_preview=lambda x: x(raw.get("output_preview")),
-        parallel_tool_calls=lambda x: x(raw.get("parallel_tool_calls")),
-        paths=lambda x: x(raw.get("paths")),
-        permission_mode=_as_str(raw.get("permission_mode")),
-        prompt=lambda x: x(raw.get("prompt")),
-        proposed_execpolicy_amendment=lambda x: x(raw.get("proposed_execpolicy_amendment")),
-        provider=lambda x: x(raw.get("provider")),
-        reason=lambda x: x(raw.get("reason")),
-        request_id=lambda x: x(raw.get("request_id")),
-        response_id=lambda x: x(raw.get("response_id")),
-        sandbox_policy=lambda x: x(raw.get("sandbox_policy")),
-        schema_version=_as_int(raw.get("schema_version")),
-        server_name=lambda x: x(raw.get("server_name")),
-        session_id=_as_str(raw.get("session_id")),
-        session_source=lambda x: x(raw.get("session_source")),
-        status=lambda x: x(raw.get("status")),
-        subagent=lambda x: x(raw.get("subagent")),
-        success=lambda x: x(raw.get("success")),
-        timestamp=_as_str(raw.get("timestamp")),
-        title=lambda x: x(raw.get("title")),
-        token_usage=lambda x: x(raw.get("token_usage")),
-        tool_count=lambda x: x(raw.get("tool_count")),
-        tool_input=lambda x: x(raw.get("tool_input")),
-        tool_name=lambda x: x(raw.get("tool_name")),
-        tool_response=lambda x: x(raw.get("tool_response")),
-        tool_use_id=lambda x: x(raw.get("tool_use_id")),
-        transcript_path=_as_str(raw.get("transcript_path")),
-        trigger=lambda x: x(raw.get("trigger")),
-        turn_id=lambda x: x(raw.get("turn_id")),
-        xcodex_event_type=_as_str(raw.get("xcodex_event_type")),
-        raw=raw,
-        extras=extras,
+        approval_policy=get("approval_policy"),
+        attempt=_as_int(get("attempt")),
+        call_id=_as_str(get("call_id")),
+        command=_as_str_list(get("command")),
+        cwd=_as_str(get("cwd")),
+        duration_ms=_as_int(get("duration_ms")),
+        event_id=_as_str(get("event_id")),
+        grant_root=_as_str(get("grant_root")),
+        has_output_schema=_as_bool(get("has_output_schema")),
+        hook_event_name=_as_str(get("hook_event_name")),
+        input_item_count=_as_int(get("input_item_count")),
+        input_messages=_as_str_list(get("input_messages")),
+        kind=_as_str(get("kind")),
+        last_assistant_message=_as_str(get("last_assistant_message")),
+        message=_as_str(get("message")),
+        model=_as_str(get("model")),
+        model_request_id=_as_str(get("model_request_id")),
+        needs_follow_up=_as_bool(get("needs_follow_up")),
+        notification_type=_as_str(get("notification_type")),
+        output_bytes=_as_int(get("output_bytes")),
+        output_preview=_as_str(get("output_preview")),
+        parallel_tool_calls=_as_bool(get("parallel_tool_calls")),
+        paths=_as_str_list(get("paths")),
+        permission_mode=_as_str(get("permission_mode")),
+        prompt=_as_str(get("prompt")),
+        proposed_execpolicy_amendment=_as_str_list(get("proposed_execpolicy_amendment")),
+        provider=_as_str(get("provider")),
+        reason=_as_str(get("reason")),
+        request_id=_as_str(get("request_id")),
+        response_id=_as_str(get("response_id")),
+        sandbox_policy=get("sandbox_policy"),
+        schema_version=_as_int(get("schema_version")),
+        server_name=_as_str(get("server_name")),
+        session_id=_as_str(get("session_id")),
+        session_source=_as_str(get("session_source")),
+        status=_as_str(get("status")),
+        subagent=_as_str(get("subagent")),
+        success=_as_bool(get("success")),
+        timestamp=_as_str(get("timestamp")),
+        title=_as_str(get("title")),
+        token_usage=get("token_usage"),
+        tool_count=_as_int(get("tool_count")),
+        tool_input=get("tool_input"),
+        tool_name=_as_str(get("tool_name")),
+        tool_response=get("tool_response"),
+        tool_use_id=_as_str(get("tool_use_id")),
+        transcript_path=_as_str(get("transcript_path")),
+        trigger=_as_str(get("trigger")),
+        turn_id=_as_str(get("turn_id")),
+        xcodex_event_type=_as_str(get("xcodex_event_type")),
+        _payload=payload,
     )
@@ -15,7 +15,7 @@ Typing:
 - TypedDict event types live in `xcodex_hooks_types.py`.
 """
 
-from typing import Any, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
 try:
     from typing import TypeGuard
@@ -24,27 +24,30 @@ except ImportError:  # pragma: no cover
         def __class_getitem__(cls, item):
             return bool
 
-from xcodex_hooks_types import HookPayload
+# Only needed for annotations: hooks that just call `as_hook_payload()` don't pay for
+# building the generated TypedDict at import time.
+if TYPE_CHECKING:
+    from xcodex_hooks_types import HookPayload
 
 
-def _has_keys(payload: Mapping[str, Any], keys: tuple[str, ...]) -> bool:
-    return all(k in payload for k in keys)
+# Keys every hook payload carries, regardless of event type.
+_REQUIRED_KEYS = frozenset(
+    {
+        "schema_version",
+        "event_id",
+        "timestamp",
+        "session_id",
+        "cwd",
+        "permission_mode",
+        "transcript_path",
+        "hook_event_name",
+        "xcodex_event_type",
+    }
+)
 
 
 def as_hook_payload(payload: Mapping[str, Any]) -> Optional[HookPayload]:
-    if not _has_keys(
-        payload,
-        (
-            "schema_version",
-            "event_id",
-            "timestamp",
-            "session_id",
-            "cwd",
-            "permission_mode",
-            "transcript_path",
-            "hook_event_name",
-            "xcodex_event_type",
-        ),
-    ):
+    # A single C-level subset test against the keys view.
+    if not _REQUIRED_KEYS <= payload.keys():
         return None
     return payload  # type: ignore[return-value]
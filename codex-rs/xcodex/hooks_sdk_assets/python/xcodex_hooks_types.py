@@ -12,6 +12,10 @@ cd codex-rs
 cargo run -p codex-core --bin hooks_python_types --features hooks-schema --quiet \
 > common/src/hooks_sdk_assets/python/xcodex_hooks_types.py
 
+These types are for static checking. Import them under `typing.TYPE_CHECKING`
+(as `xcodex_hooks.py` and `xcodex_hooks_runtime.py` do) so hook processes don't
+build the TypedDict at startup.
+
 Docs:
 - Hooks overview: docs/xcodex/hooks.md
 - Machine-readable schema: docs/xcodex/hooks.schema.json
@@ -19,7 +23,7 @@ Docs:
 """
 
 
-from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
+from typing import Any, Dict, List, Literal, TypedDict, Union
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -4,22 +4,27 @@ Example hook: append every hook payload to CODEX_HOME/hooks.jsonl (one JSON obje
 
 This is useful for auditing/debugging, but treat payloads as sensitive.
 """
-import json
 import os
-import pathlib
+from typing import Any
 
 import xcodex_hooks
 
+# Compact UTF-8 JSON; the stdlib fallback uses orjson's separators and non-ASCII output.
+try:
+    from orjson import dumps as _dumps
+except ImportError:  # pragma: no cover
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 def main() -> int:
     payload = xcodex_hooks.read_payload()
     # Add your logic here. For example, filter by event type:
     # if payload.get("type") != "tool-call-finished": return 0
-    codex_home = pathlib.Path(os.environ.get("CODEX_HOME", str(pathlib.Path.home() / ".xcodex")))
-    out = codex_home / "hooks.jsonl"
-    out.parent.mkdir(parents=True, exist_ok=True)
-    with out.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(payload) + "\n")
+    out = os.path.join(xcodex_hooks.codex_home(), "hooks.jsonl")
+    xcodex_hooks.append_bytes(out, _dumps(payload) + b"\n")
     return 0
 
 
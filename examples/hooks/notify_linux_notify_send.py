@@ -2,7 +2,6 @@
 """
 Example hook: show a Linux desktop notification for hook events (notify-send).
 """
-import json
 import shutil
 import subprocess
 
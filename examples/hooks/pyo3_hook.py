@@ -11,11 +11,17 @@ This file is meant to be copied under $CODEX_HOME/hooks/ and referenced from:
   [hooks.pyo3]
   script_path = "hooks/pyo3_hook.py"
   callable = "on_event"
+  # Optional: deliver events to `on_events()` in batches of up to N.
+  # batch_size = 32
+
+Set `XCODEX_HOOK_TYPES` to a comma-separated list of `xcodex_event_type` values
+(for example `tool-call-finished`) to ignore every other event.
 """
 
-import json
+import os
 import pathlib
-from datetime import datetime
+import time
+from typing import Any, BinaryIO, Dict, List
 
 # `xcodex` will append both:
 # - the directory containing this script, and
@@ -26,6 +32,53 @@ try:
 except Exception:  # pragma: no cover
     xcodex_hooks_runtime = None
 
+# Compact UTF-8 JSON; the stdlib fallback uses orjson's separators and non-ASCII output.
+try:
+    from orjson import dumps as _dumps
+except ImportError:  # pragma: no cover
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# Logs live next to the user's CODEX_HOME hooks directory.
+_HOOKS_DIR = pathlib.Path(__file__).resolve().parent
+_OUT_PATH = _HOOKS_DIR.parent / "hooks-pyo3.jsonl"
+_SUMMARY_PATH = _HOOKS_DIR.parent / "hooks-tool-calls-pyo3.log"
+
+# Event types to handle, from `XCODEX_HOOK_TYPES`; None means all of them.
+_WANTED_TYPES = (
+    frozenset(
+        name.strip() for name in os.environ.get("XCODEX_HOOK_TYPES", "").split(",") if name.strip()
+    )
+    or None
+)
+
+_SUMMARY_FORMAT = (
+    "type=tool-call-finished tool=%s status=%s success=%s "
+    "duration_ms=%s output_bytes=%s cwd=%s\n"
+)
+
+# Keep append handles open across events. They are unbuffered because xcodex never
+# shuts the embedded interpreter down, so anything queued in Python (or left to
+# atexit) could be lost. For fewer writes, set `hooks.pyo3.batch_size`: xcodex then
+# batches events into `on_events()` and flushes on turn completion and session end.
+_handles: Dict[pathlib.Path, BinaryIO] = {}
+
+
+def _append(path: pathlib.Path, data: bytes) -> None:
+    f = _handles.get(path)
+    if f is None:
+        f = _handles[path] = open(path, "ab", buffering=0)
+    f.write(data)
+
+
+def _timestamp() -> str:
+    # UTC `YYYY-MM-DDTHH:MM:SS.ffffffZ`, without building a datetime per event.
+    secs, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return "%s.%06dZ" % (time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs)), nanos // 1000)
+
 
 def on_event(event: dict) -> None:
     """
@@ -33,29 +86,46 @@ def on_event(event: dict) -> None:
 
     The event dict uses the same schema as external hooks.
     """
+    on_events([event])
+
+
+def on_events(events: List[dict]) -> None:
+    """
+    Called with a batch of events when `hooks.pyo3.batch_size` is set.
+
+    Each log file gets a single write per batch.
+    """
+    log_lines: List[bytes] = []
+    summary_lines: List[bytes] = []
+    for event in events:
+        event_type = event.get("xcodex_event_type")
+        if _WANTED_TYPES is not None and event_type not in _WANTED_TYPES:
+            continue
+
+        # Example: write a JSONL file with all events.
+        record = {
+            "ts": _timestamp(),
+            "type": event_type,
+            "event_id": event.get("event_id"),
+            # Keep the raw event for debugging.
+            "event": event,
+        }
+        log_lines.append(_dumps(record) + b"\n")
+
+        # Optional: for tool-call-finished events, also append a compact summary line.
+        if event_type == "tool-call-finished":
+            get = event.get
+            line = _SUMMARY_FORMAT % (
+                get("tool_name"),
+                get("status"),
+                get("success"),
+                get("duration_ms"),
+                get("output_bytes"),
+                get("cwd"),
+            )
+            summary_lines.append(line.encode("utf-8"))
 
-    # Example: write a JSONL file with all events.
-    # Store it next to the user's CODEX_HOME hooks directory.
-    hooks_dir = pathlib.Path(__file__).resolve().parent
-    out_path = hooks_dir.parent / "hooks-pyo3.jsonl"
-
-    record = {
-        "ts": datetime.utcnow().isoformat() + "Z",
-        "type": event.get("type"),
-        "event_id": event.get("event-id"),
-        # Keep the raw event for debugging.
-        "event": event,
-    }
-
-    with out_path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record, ensure_ascii=False) + "\n")
-
-    # Optional: for tool-call-finished events, also append a compact summary line.
-    if event.get("type") == "tool-call-finished":
-        summary_path = hooks_dir.parent / "hooks-tool-calls-pyo3.log"
-        duration_ms = event.get("duration-ms")
-        output_bytes = event.get("output-bytes")
-
-        line = f"type=tool-call-finished tool={event.get('tool-name')} status={event.get('status')} success={event.get('success')} duration_ms={duration_ms} output_bytes={output_bytes} cwd={event.get('cwd')}\n"
-        with summary_path.open("a", encoding="utf-8") as f:
-            f.write(line)
+    if log_lines:
+        _append(_OUT_PATH, b"".join(log_lines))
+    if summary_lines:
+        _append(_SUMMARY_PATH, b"".join(summary_lines))
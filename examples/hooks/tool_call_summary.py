@@ -2,35 +2,33 @@
 """
 Example hook: append a compact summary for tool-call-finished events.
 """
-import json
+
 import os
-import pathlib
 
 import xcodex_hooks
 
+_LINE_FORMAT = (
+    "type=tool-call-finished tool=%s status=%s success=%s "
+    "duration_ms=%s output_bytes=%s cwd=%s\n"
+)
+
 
 def main() -> int:
-    payload = xcodex_hooks.read_payload()
-    if payload.get("type") != "tool-call-finished":
+    payload = xcodex_hooks.read_payload(event_types={"tool-call-finished"})
+    if payload is None:
         return 0
 
-    tool_name = payload.get("tool-name") or payload.get("tool_name") or "unknown"
+    tool_name = payload.get("tool_name") or "unknown"
     status = payload.get("status") or "unknown"
-    duration_ms = payload.get("duration-ms") or payload.get("duration_ms") or 0
+    duration_ms = payload.get("duration_ms") or 0
     success = payload.get("success")
-    output_bytes = payload.get("output-bytes") or payload.get("output_bytes") or 0
+    output_bytes = payload.get("output_bytes") or 0
     cwd = payload.get("cwd") or ""
 
-    codex_home = pathlib.Path(os.environ.get("CODEX_HOME", str(pathlib.Path.home() / ".xcodex")))
-    out = codex_home / "hooks-tool-calls.log"
-    out.parent.mkdir(parents=True, exist_ok=True)
+    out = os.path.join(xcodex_hooks.codex_home(), "hooks-tool-calls.log")
 
-    line = (
-        f"type=tool-call-finished tool={tool_name} status={status} "
-        f"success={success} duration_ms={duration_ms} output_bytes={output_bytes} cwd={cwd}\n"
-    )
-    with out.open("a", encoding="utf-8") as f:
-        f.write(line)
+    line = _LINE_FORMAT % (tool_name, status, success, duration_ms, output_bytes, cwd)
+    xcodex_hooks.append_bytes(out, line.encode("utf-8"))
     return 0
 
 
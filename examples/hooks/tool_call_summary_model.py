@@ -8,11 +8,15 @@ fields in `.extras` / `.raw`.
 """
 
 import os
-import pathlib
 
 import xcodex_hooks
 import xcodex_hooks_models
 
+_LINE_FORMAT = (
+    "type=tool-call-finished tool=%s status=%s success=%s "
+    "duration_ms=%s output_bytes=%s cwd=%s\n"
+)
+
 
 def main() -> int:
     event = xcodex_hooks.read_payload_model()
@@ -26,16 +30,10 @@ def main() -> int:
     output_bytes = event.output_bytes or 0
     cwd = event.cwd or ""
 
-    codex_home = pathlib.Path(os.environ.get("CODEX_HOME", str(pathlib.Path.home() / ".xcodex")))
-    out = codex_home / "hooks-tool-calls.log"
-    out.parent.mkdir(parents=True, exist_ok=True)
+    out = os.path.join(xcodex_hooks.codex_home(), "hooks-tool-calls.log")
 
-    line = (
-        f"type=tool-call-finished tool={tool_name} status={status} "
-        f"success={success} duration_ms={duration_ms} output_bytes={output_bytes} cwd={cwd}\n"
-    )
-    with out.open("a", encoding="utf-8") as f:
-        f.write(line)
+    line = _LINE_FORMAT % (tool_name, status, success, duration_ms, output_bytes, cwd)
+    xcodex_hooks.append_bytes(out, line.encode("utf-8"))
 
     return 0
 
@@ -12,12 +12,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 import fnmatch
+import functools
+import os
 import re
 import sys
+from typing import Iterator
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
 INCLUDE_RE = re.compile(r'include_(?:str|bytes)!\(\s*"([^"]+)"\s*\)')
+COMPILE_DATA_GLOB_RE = re.compile(r"compile_data\s*=\s*glob\(\s*\[([^\]]*)\]", flags=re.DOTALL)
+QUOTED_STRING_RE = re.compile(r'"([^"]+)"')
 
 
 @dataclass(frozen=True)
@@ -37,6 +42,7 @@ def find_repo_root(start: Path) -> Path:
         cur = cur.parent
 
 
+@functools.lru_cache(maxsize=None)
 def nearest_bazel_package_dir(path: Path) -> Path | None:
     cur = path
     while True:
@@ -49,19 +55,30 @@ def nearest_bazel_package_dir(path: Path) -> Path | None:
         cur = cur.parent
 
 
+@functools.lru_cache(maxsize=None)
+def read_build_file(pkg_dir: Path) -> str:
+    return (pkg_dir / "BUILD.bazel").read_text(encoding="utf-8")
 
 
 def extract_compile_data_globs(build_text: str) -> list[str]:
     # Heuristic: capture compile_data = glob(["..."]) and compile_data = glob([ ... ]).
-    m = re.search(r"compile_data\s*=\s*glob\(\s*\[([^\]]*)\]", build_text, flags=re.DOTALL)
+    m = COMPILE_DATA_GLOB_RE.search(build_text)
     if not m:
         return []
     body = m.group(1)
-    return re.findall(r'"([^"]+)"', body)
+    return QUOTED_STRING_RE.findall(body)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_data_matcher(pkg_dir: Path) -> re.Pattern[str] | None:
+    # Translate the package's globs once into a single alternation so each
+    # include is one regex match instead of one fnmatch call per glob.
+    globs = extract_compile_data_globs(read_build_file(pkg_dir))
+    if not globs:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(g)})" for g in globs))
 
 
-def globs_match_path(globs: list[str], rel_path: str) -> bool:
-    return any(fnmatch.fnmatch(rel_path, g) for g in globs)
 def bazel_build_has_all_files_glob(build_text: str) -> bool:
     # Heuristic: accept compile_data = glob(include = ["**"], ...)
     return (
@@ -71,32 +88,66 @@ def bazel_build_has_all_files_glob(build_text: str) -> bool:
     )
 
 
-def bazel_build_mentions_file(build_text: str, rel_path: str) -> bool:
-    # Heuristic: accept explicit list entries.
-    return f'"{rel_path}"' in build_text
+@functools.lru_cache(maxsize=None)
+def build_quoted_strings(pkg_dir: Path) -> frozenset[str]:
+    # Every run of text between two adjacent quotes, so membership matches
+    # `f'"{rel_path}"' in build_text` for any quote-free rel_path.
+    return frozenset(read_build_file(pkg_dir).split('"')[1:-1])
 
 
-def collect_includes() -> list[IncludeRef]:
+def bazel_build_mentions_file(pkg_dir: Path, rel_path: str) -> bool:
+    # Heuristic: accept explicit list entries.
+    return rel_path in build_quoted_strings(pkg_dir)
+
+
+def iter_rust_files(root: str) -> Iterator[str]:
+    # os.scandir reuses the d_type from readdir, so unlike Path.rglob this
+    # needs no per-entry stat or Path object.
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".rs"):
+                    yield entry.path
+
+
+def scan_rust_file(path: str) -> list[IncludeRef]:
+    with open(path, "rb") as f:
+        data = f.read()
+    # Most Rust files never include anything; skip decoding and the regex.
+    if b"include_" not in data:
+        return []
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return []
+
+    src_file = Path(path)
     includes: list[IncludeRef] = []
-    for src_file in (REPO_ROOT / "codex-rs").rglob("*.rs"):
-        try:
-            text = src_file.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
+    for match in INCLUDE_RE.finditer(text):
+        include_path = match.group(1)
+        # Skip non-literal or macro-generated paths.
+        if "{" in include_path or "}" in include_path:
             continue
-
-        for match in INCLUDE_RE.finditer(text):
-            include_path = match.group(1)
-            # Skip non-literal or macro-generated paths.
-            if "{" in include_path or "}" in include_path:
-                continue
-            resolved = (src_file.parent / include_path).resolve()
-            includes.append(
-                IncludeRef(
-                    src_file=src_file,
-                    include_path=include_path,
-                    resolved_path=resolved,
-                )
+        # Lexical normalization is enough to compare against the package dir and
+        # avoids a realpath walk per include.
+        resolved = Path(os.path.normpath(os.path.join(src_file.parent, include_path)))
+        includes.append(
+            IncludeRef(
+                src_file=src_file,
+                include_path=include_path,
+                resolved_path=resolved,
             )
+        )
+    return includes
+
+
+def collect_includes() -> list[IncludeRef]:
+    includes: list[IncludeRef] = []
+    for src_file in iter_rust_files(str(REPO_ROOT / "codex-rs")):
+        includes.extend(scan_rust_file(src_file))
     return includes
 
 
@@ -131,17 +182,17 @@ def main() -> int:
             )
             continue
 
-        build_text = (pkg_dir / "BUILD.bazel").read_text(encoding="utf-8")
+        build_text = read_build_file(pkg_dir)
 
         if bazel_build_has_all_files_glob(build_text):
             continue
 
         rel_str = rel_to_pkg.as_posix()
-        if bazel_build_mentions_file(build_text, rel_str):
+        if bazel_build_mentions_file(pkg_dir, rel_str):
             continue
 
-        compile_globs = extract_compile_data_globs(build_text)
-        if compile_globs and globs_match_path(compile_globs, rel_str):
+        matcher = compile_data_matcher(pkg_dir)
+        if matcher is not None and matcher.match(rel_str):
             continue
 
         problems.append(
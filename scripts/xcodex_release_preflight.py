@@ -3,11 +3,13 @@
 
 from __future__ import annotations
 
+import ast
 import importlib.util
 import os
 from pathlib import Path
 import sys
 from types import ModuleType
+from typing import Any
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 WORKFLOW = REPO_ROOT / ".github" / "workflows" / "xcodex-release.yml"
@@ -30,7 +32,9 @@ REQUIRED_ARM_RUNNER_PAIRS = {
 
 def main() -> int:
     allow_musl_omission = os.environ.get("XCODEX_ALLOW_MUSL_OMISSION") == "1"
-    workflow_src = WORKFLOW.read_text(encoding="utf-8").replace("\r\n", "\n")
+    # No CRLF normalization needed: the condition below is a single line and
+    # parse_workflow_matrix_entries() splits with str.splitlines().
+    workflow_src = WORKFLOW.read_bytes().decode("utf-8")
     cargo_chef_condition = (
         "matrix.target == 'aarch64-apple-darwin' || matrix.target == "
         "'aarch64-unknown-linux-gnu' || (matrix.target == 'x86_64-apple-darwin' && "
@@ -46,7 +50,10 @@ def main() -> int:
         raise SystemExit("No matrix include entries found in xcodex-release workflow.")
 
     installer = load_module(INSTALLER, "xcodex_install_native_deps")
-    npm_packager = load_module(BUILD_NPM_PACKAGE, "xcodex_build_npm_package")
+    npm_constants = extract_top_level_assignments(
+        BUILD_NPM_PACKAGE.read_bytes(),
+        {"PACKAGE_NATIVE_COMPONENTS", "WINDOWS_ONLY_COMPONENTS"},
+    )
 
     binary_targets = tuple(installer.BINARY_TARGETS)
     if not binary_targets:
@@ -110,8 +117,8 @@ def main() -> int:
     if missing_rg:
         raise SystemExit(f"RG_TARGET_PLATFORM_PAIRS missing targets: {missing_rg}")
 
-    package_components = npm_packager.PACKAGE_NATIVE_COMPONENTS
-    windows_only_components = npm_packager.WINDOWS_ONLY_COMPONENTS
+    package_components = npm_constants["PACKAGE_NATIVE_COMPONENTS"]
+    windows_only_components = npm_constants["WINDOWS_ONLY_COMPONENTS"]
     binary_components = installer.BINARY_COMPONENTS
 
     expected_components = {
@@ -157,6 +164,12 @@ def parse_workflow_matrix_entries(workflow_src: str) -> list[dict[str, str]]:
     current_entry: dict[str, str] | None = None
     entry_indent = None
 
+    def finish_entry(entry: dict[str, str]) -> None:
+        # Drop entries without a runner/target as they close instead of
+        # filtering a second list afterwards.
+        if entry.get("runner") and entry.get("target"):
+            entries.append(entry)
+
     for line in lines:
         stripped = line.strip()
         indent = len(line) - len(line.lstrip(" "))
@@ -176,7 +189,7 @@ def parse_workflow_matrix_entries(workflow_src: str) -> list[dict[str, str]]:
 
         if stripped and indent <= include_indent:
             if current_entry is not None:
-                entries.append(current_entry)
+                finish_entry(current_entry)
             break
 
         if not stripped or stripped.startswith("#"):
@@ -184,7 +197,7 @@ def parse_workflow_matrix_entries(workflow_src: str) -> list[dict[str, str]]:
 
         if stripped.startswith("- "):
             if current_entry is not None:
-                entries.append(current_entry)
+                finish_entry(current_entry)
             current_entry = {}
             entry_indent = indent
             remainder = stripped[2:].strip()
@@ -198,7 +211,7 @@ def parse_workflow_matrix_entries(workflow_src: str) -> list[dict[str, str]]:
             continue
 
         if indent <= entry_indent:
-            entries.append(current_entry)
+            finish_entry(current_entry)
             current_entry = None
             entry_indent = None
             continue
@@ -209,16 +222,8 @@ def parse_workflow_matrix_entries(workflow_src: str) -> list[dict[str, str]]:
         current_entry[key.strip()] = parse_yaml_scalar(value)
 
     if current_entry is not None:
-        entries.append(current_entry)
-
-    matrix_entries = []
-    for entry in entries:
-        runner = entry.get("runner")
-        target = entry.get("target")
-        if not runner or not target:
-            continue
-        matrix_entries.append(entry)
-    return matrix_entries
+        finish_entry(current_entry)
+    return entries
 
 
 def parse_yaml_scalar(value: str) -> str:
@@ -238,6 +243,51 @@ def load_module(path: Path, module_name: str) -> ModuleType:
     return module
 
 
+def extract_top_level_assignments(src: str | bytes, names: set[str]) -> dict[str, Any]:
+    """Return literal values of top-level `names` assigned in `src`.
+
+    The module is parsed once and never executed, so only plain literal
+    assignments (`NAME = ...` or `NAME: T = ...`) are supported.
+    """
+    values: dict[str, Any] = {}
+    for node in ast.parse(src).body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        for target in targets:
+            if isinstance(target, ast.Name) and target.id in names:
+                values[target.id] = literal_value(node.value)
+
+    missing = sorted(names - values.keys())
+    if missing:
+        raise SystemExit(f"Missing top-level literal assignments: {missing}")
+    return values
+
+
+def literal_value(node: ast.expr) -> Any:
+    """Decode the plain containers and constants used by our script constants.
+
+    Anything else (negative numbers, f-strings, ...) is left to ast.literal_eval.
+    """
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.List):
+        return [literal_value(elt) for elt in node.elts]
+    if isinstance(node, ast.Tuple):
+        return tuple(literal_value(elt) for elt in node.elts)
+    if isinstance(node, ast.Set):
+        return {literal_value(elt) for elt in node.elts}
+    if isinstance(node, ast.Dict) and None not in node.keys:
+        return {
+            literal_value(key): literal_value(value)
+            for key, value in zip(node.keys, node.values)
+        }
+    return ast.literal_eval(node)
+
+
 def verify_artifact_lookup_coverage(
     *,
     installer: ModuleType,